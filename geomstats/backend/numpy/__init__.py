@@ -20,6 +20,7 @@ from numpy import (  # NOQA
     array,
     asarray,
     average,
+    broadcast_to,
     clip,
     concatenate,
     cos,
@@ -10,6 +10,7 @@ from numpy.linalg import (  # NOQA
     inv,
     norm,
     matrix_rank,
+    solve,
     svd
 )
 
@@ -17,81 +18,195 @@ from numpy.linalg import (  # NOQA
 from geomstats.backend.numpy.__init__ import to_ndarray
 
 
+_PADE13_COEFFICIENTS = (
+    64764752532480000., 32382376266240000., 7771770303897600.,
+    1187353796428800., 129060195264000., 10559470521600.,
+    670442572800., 33522128640., 1323241920., 40840800.,
+    960960., 16380., 182., 1.)
+_PADE13_THETA = 5.371920351148152
+
+
+def _expm(x):
+    """Compute the matrix exponentials of a stack of matrices."""
+    try:
+        return scipy.linalg.expm(x)
+    except ValueError:
+        # SciPy < 1.9 only accepts a single square matrix.
+        return np.stack([scipy.linalg.expm(mat) for mat in x])
+
+
+def _logm(x):
+    """Compute the matrix logarithms of a stack of matrices."""
+    return np.stack([scipy.linalg.logm(mat) for mat in x])
+
+
+def _sqrtm(x):
+    """Compute the matrix square roots of a stack of matrices."""
+    return np.stack([scipy.linalg.sqrtm(mat) for mat in x])
+
+
+def _is_diagonal(x):
+    """Check that all matrices of a stack are diagonal."""
+    n_mats, n, _ = x.shape
+    off_diagonal = x.reshape(n_mats, n * n)[:, :-1].reshape(
+        n_mats, n - 1, n + 1)[:, :, 1:]
+    return not np.any(off_diagonal)
+
+
+def _apply_to_diagonal(func, x):
+    """Apply func to the entries of a stack of diagonal matrices."""
+    diagonal = func(np.diagonal(x, axis1=1, axis2=2))
+    result = np.zeros(x.shape, dtype=diagonal.dtype)
+    indices = np.arange(x.shape[-1])
+    result[:, indices, indices] = diagonal
+    return result
+
+
+def _apply_to_eigvals(func, eigvals, eigvecs):
+    """Apply func to the eigenvalues of a stack of symmetric matrices."""
+    transp_eigvecs = np.transpose(eigvecs, axes=(0, 2, 1))
+    return np.matmul(eigvecs * func(eigvals)[..., None, :], transp_eigvecs)
+
+
 def is_symmetric(x):
     new_x = to_ndarray(x, to_ndim=3)
-    return (new_x - np.transpose(new_x, axes=(0, 2, 1)) == 0).all()
+    # Probe two pairs of off-diagonal entries before the full comparison,
+    # as most non-symmetric inputs, e.g. skew-symmetric ones, fail there.
+    if new_x.shape[-1] > 1 and (
+            np.any(new_x[:, 0, 1] != new_x[:, 1, 0])
+            or np.any(new_x[:, 0, -1] != new_x[:, -1, 0])):
+        return False
+    return not np.any(new_x - np.transpose(new_x, axes=(0, 2, 1)))
+
+
+def _expm_pade13(x):
+    """Compute the matrix exponentials of a stack of matrices.
+
+    Uses a batched Pade approximant of degree 13 with scaling and squaring.
+    The Frobenius norm is submultiplicative, so it is used in place of the
+    1-norm to choose the number of squarings of each matrix.
+    """
+    x_norm = np.linalg.norm(x, axis=(-2, -1))
+    n_squarings = np.ceil(np.log2(
+        np.maximum(x_norm, _PADE13_THETA) / _PADE13_THETA)).astype(int)
+    scaled_x = x / (2. ** n_squarings)[:, None, None]
+
+    b = _PADE13_COEFFICIENTS
+    identity = np.eye(x.shape[-1])
+    x2 = np.matmul(scaled_x, scaled_x)
+    x4 = np.matmul(x2, x2)
+    x6 = np.matmul(x2, x4)
+    odd_part = np.matmul(
+        scaled_x,
+        np.matmul(x6, b[13] * x6 + b[11] * x4 + b[9] * x2)
+        + b[7] * x6 + b[5] * x4 + b[3] * x2 + b[1] * identity)
+    even_part = (
+        np.matmul(x6, b[12] * x6 + b[10] * x4 + b[8] * x2)
+        + b[6] * x6 + b[4] * x4 + b[2] * x2 + b[0] * identity)
+    result = np.linalg.solve(even_part - odd_part, even_part + odd_part)
+
+    for i in range(n_squarings.max(initial=0)):
+        to_square = n_squarings > i
+        result[to_square] = np.matmul(result[to_square], result[to_square])
+
+    return result
 
 
 def expsym(x):
+    """Compute the matrix exponentials of a stack of symmetric matrices."""
     eigvals, eigvecs = np.linalg.eigh(x)
-    eigvals = np.exp(eigvals)
-    eigvals = np.vectorize(np.diag, signature='(n)->(n,n)')(eigvals)
-    transp_eigvecs = np.transpose(eigvecs, axes=(0, 2, 1))
-    result = np.matmul(eigvecs, eigvals)
-    result = np.matmul(result, transp_eigvecs)
-    return result
+    return _apply_to_eigvals(np.exp, eigvals, eigvecs)
+
+
+def expm(x, assume_symmetric=None):
+    """Compute the matrix exponential.
 
+    Parameters
+    ----------
+    x : array-like, shape=[n_samples, n, n]
+    assume_symmetric : bool, optional
+        Whether x is known to be symmetric. If None, the symmetry of x
+        is checked.
 
-def expm(x):
+    Returns
+    -------
+    result : array-like, shape=[n_samples, n, n]
+    """
     ndim = x.ndim
     new_x = to_ndarray(x, to_ndim=3)
-    if is_symmetric(new_x):
+    if assume_symmetric is None:
+        assume_symmetric = is_symmetric(new_x)
+    if assume_symmetric and _is_diagonal(new_x):
+        result = _apply_to_diagonal(np.exp, new_x)
+    elif assume_symmetric:
         result = expsym(new_x)
+    elif new_x.shape[-1] in (3, 4) and len(new_x) > 1:
+        # On stacks of small matrices, the batched Pade approximant is
+        # much faster than SciPy, whose cost is dominated by overhead.
+        result = _expm_pade13(new_x)
     else:
-        result = np.vectorize(scipy.linalg.expm,
-                              signature='(n,m)->(n,m)')(new_x)
+        result = _expm(new_x)
 
     if ndim == 2:
         return result[0]
     return result
 
 
-def logm(x):
+def logm(x, assume_symmetric=None):
     ndim = x.ndim
     new_x = to_ndarray(x, to_ndim=3)
-    if is_symmetric(new_x):
+    if assume_symmetric is None:
+        assume_symmetric = is_symmetric(new_x)
+    if (assume_symmetric and _is_diagonal(new_x)
+            and (np.diagonal(new_x, axis1=1, axis2=2) > 0).all()):
+        result = _apply_to_diagonal(np.log, new_x)
+    elif assume_symmetric:
         eigvals, eigvecs = np.linalg.eigh(new_x)
-        eigvals = np.log(eigvals)
         if (eigvals > 0).all():
-            eigvals = np.vectorize(np.diag, signature='(n)->(n,n)')(eigvals)
-            transp_eigvecs = np.transpose(eigvecs, axes=(0, 2, 1))
-            result = np.matmul(eigvecs, eigvals)
-            result = np.matmul(result, transp_eigvecs)
+            result = _apply_to_eigvals(np.log, eigvals, eigvecs)
         else:
-            result = np.vectorize(scipy.linalg.logm,
-                                  signature='(n,m)->(n,m)')(new_x)
+            result = _logm(new_x)
     else:
-        result = np.vectorize(scipy.linalg.logm,
-                              signature='(n,m)->(n,m)')(new_x)
+        result = _logm(new_x)
 
     if ndim == 2:
         return result[0]
     return result
 
 
-def powerm(x, power):
+def powerm(x, power, assume_symmetric=None):
     ndim = x.ndim
     new_x = to_ndarray(x, to_ndim=3)
-    if is_symmetric(new_x):
+    if assume_symmetric is None:
+        assume_symmetric = is_symmetric(new_x)
+    if assume_symmetric:
         eigvals, eigvecs = np.linalg.eigh(new_x)
-        eigvals = eigvals**power
-        if (eigvals > 0).all():
-            eigvals = np.vectorize(np.diag, signature='(n)->(n,n)')(eigvals)
-            transp_eigvecs = np.transpose(eigvecs, axes=(0, 2, 1))
-            result = np.matmul(eigvecs, eigvals)
-            result = np.matmul(result, transp_eigvecs)
+        power_is_integer = float(power).is_integer()
+        if power_is_integer:
+            # Integer powers only require invertibility when negative.
+            use_eigvals = power >= 0 or (eigvals != 0).all()
+        else:
+            use_eigvals = (eigvals > 0).all()
+        if use_eigvals:
+            if power == .5:
+                result = _apply_to_eigvals(np.sqrt, eigvals, eigvecs)
+            elif power == -.5:
+                result = _apply_to_eigvals(
+                    lambda vals: 1. / np.sqrt(vals), eigvals, eigvecs)
+            elif power_is_integer:
+                result = _apply_to_eigvals(
+                    lambda vals: vals ** int(power), eigvals, eigvecs)
+            else:
+                result = _apply_to_eigvals(
+                    lambda vals: vals ** power, eigvals, eigvecs)
         else:
-            log_x = np.vectorize(scipy.linalg.logm,
-                                 signature='(n,m)->(n,m)')(new_x)
+            log_x = _logm(new_x)
             p_log_x = power * log_x
-            result = np.vectorize(scipy.linalg.expm,
-                                  signature='(n,m)->(n,m)')(p_log_x)
+            result = _expm(p_log_x)
     else:
-        log_x = np.vectorize(scipy.linalg.logm,
-                             signature='(n,m)->(n,m)')(new_x)
+        log_x = _logm(new_x)
         p_log_x = power * log_x
-        result = np.vectorize(scipy.linalg.expm,
-                              signature='(n,m)->(n,m)')(p_log_x)
+        result = _expm(p_log_x)
 
     if ndim == 2:
         return result[0]
@@ -99,8 +214,20 @@ def powerm(x, power):
 
 
 def sqrtm(x):
-    return np.vectorize(
-        scipy.linalg.sqrtm, signature='(n,m)->(n,m)')(x)
+    ndim = x.ndim
+    new_x = to_ndarray(x, to_ndim=3)
+    if is_symmetric(new_x):
+        eigvals, eigvecs = np.linalg.eigh(new_x)
+        if (eigvals > 0).all():
+            result = _apply_to_eigvals(np.sqrt, eigvals, eigvecs)
+        else:
+            result = _sqrtm(new_x)
+    else:
+        result = _sqrtm(new_x)
+
+    if ndim == 2:
+        return result[0]
+    return result
 
 
 def exp(*args, **kwargs):
@@ -108,6 +235,10 @@ def exp(*args, **kwargs):
 
 
 def qr(*args, **kwargs):
-    return np.vectorize(np.linalg.qr,
-                        signature='(n,m)->(n,k),(k,m)',
-                        excluded=['mode'])(*args, **kwargs)
+    try:
+        return np.linalg.qr(*args, **kwargs)
+    except np.linalg.LinAlgError:
+        # NumPy < 1.22 only accepts a single matrix.
+        return np.vectorize(np.linalg.qr,
+                            signature='(n,m)->(n,k),(k,m)',
+                            excluded=['mode'])(*args, **kwargs)
@@ -358,6 +358,10 @@ def tile(x, y):
     return array(_np.tile(x, y))
 
 
+def broadcast_to(x, shape):
+    return x.expand(shape)
+
+
 def clip(x, amin, amax):
     if x.dtype == 'torch.float':
         return torch.clamp(x, amin, amax)
@@ -447,7 +451,7 @@ def mean(x, axis=None):
     if axis is None:
         return torch.mean(x)
     else:
-        return _np.mean(x, axis)
+        return torch.mean(x, dim=axis)
 
 
 def argmin(*args, **kwargs):
@@ -5,7 +5,7 @@ import scipy.linalg
 import torch
 
 
-def expm(x):
+def expm(x, assume_symmetric=None):
     np_expm = np.vectorize(
         scipy.linalg.expm, signature='(n,m)->(n,m)')(x)
     return torch.from_numpy(np_expm)
@@ -15,6 +15,10 @@ def inv(*args, **kwargs):
     return torch.from_numpy(np.linalg.inv(*args, **kwargs))
 
 
+def solve(*args, **kwargs):
+    return torch.from_numpy(np.linalg.solve(*args, **kwargs))
+
+
 def eigvalsh(*args, **kwargs):
     return torch.from_numpy(np.linalg.eigvalsh(*args, **kwargs))
 
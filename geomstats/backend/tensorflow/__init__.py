@@ -121,6 +121,10 @@ def tile(x, reps):
     return tf.tile(x, reps)
 
 
+def broadcast_to(x, shape):
+    return tf.broadcast_to(x, shape)
+
+
 def eval(x):
     if tf.executing_eagerly():
         return x
@@ -19,11 +19,11 @@ def sqrtm(sym_mat):
     return sqrt_mat
 
 
-def expm(x):
+def expm(x, assume_symmetric=None):
     return tf.linalg.expm(x)
 
 
-def logm(x):
+def logm(x, assume_symmetric=None):
     x = tf.cast(x, tf.complex64)
     logm = tf.linalg.logm(x)
     logm = tf.cast(logm, tf.float32)
@@ -55,6 +55,10 @@ def inv(x):
     return tf.linalg.inv(x)
 
 
+def solve(a, b):
+    return tf.linalg.solve(a, b)
+
+
 def matrix_rank(x):
     return tf.rank(x)
 
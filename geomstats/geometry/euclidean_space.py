@@ -31,10 +31,8 @@ class EuclideanSpace(Manifold):
         """
         point = gs.to_ndarray(point, to_ndim=2)
         n_points, point_dim = point.shape
-        belongs = point_dim == self.dimension
-        belongs = gs.to_ndarray(belongs, to_ndim=1)
-        belongs = gs.to_ndarray(belongs, to_ndim=2, axis=1)
-        belongs = gs.tile(belongs, (n_points, 1))
+        belongs = gs.array(point_dim == self.dimension)
+        belongs = gs.broadcast_to(belongs, (n_points, 1))
 
         return belongs
 
@@ -69,6 +67,7 @@ class EuclideanMetric(RiemannianMetric):
         assert isinstance(dimension, int) and dimension > 0
         super(EuclideanMetric, self).__init__(dimension=dimension,
                                               signature=(dimension, 0, 0))
+        self._inner_product_mat = gs.to_ndarray(gs.eye(dimension), to_ndim=3)
 
     def inner_product_matrix(self, base_point=None):
         """Compute inner product matrix, independent of the base point.
@@ -81,9 +80,7 @@ class EuclideanMetric(RiemannianMetric):
         -------
         inner_prod_mat: array-like, shape=[n_samples, dimension, dimension]
         """
-        mat = gs.eye(self.dimension)
-        mat = gs.to_ndarray(mat, to_ndim=3)
-        return mat
+        return self._inner_product_mat
 
     def exp(self, tangent_vec, base_point):
         """Compute exp map of a base point in tangent vector direction.
@@ -151,14 +148,12 @@ class EuclideanMetric(RiemannianMetric):
         if isinstance(points, list):
             points = gs.vstack(points)
         points = gs.to_ndarray(points, to_ndim=2)
-        n_points = gs.shape(points)[0]
 
-        if isinstance(weights, list):
-            weights = gs.vstack(weights)
-        elif weights is None:
-            weights = gs.ones((n_points, ))
-
-        weighted_points = gs.einsum('n,nj->nj', weights, points)
-        mean = (gs.sum(weighted_points, axis=0) / gs.sum(weights))
+        if weights is None:
+            mean = gs.mean(points, axis=0)
+        else:
+            if isinstance(weights, list):
+                weights = gs.vstack(weights)
+            mean = gs.einsum('n,nj->j', weights, points) / gs.sum(weights)
         mean = gs.to_ndarray(mean, to_ndim=2)
         return mean
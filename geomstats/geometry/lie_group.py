@@ -46,15 +46,16 @@ class LieGroup(Manifold):
         assert dimension > 0
         Manifold.__init__(self, dimension)
 
+        identity_mat = gs.eye(self.dimension)
         self.left_canonical_metric = InvariantMetric(
             group=self,
-            inner_product_mat_at_identity=gs.eye(self.dimension),
+            inner_product_mat_at_identity=identity_mat,
             left_or_right="left",
         )
 
         self.right_canonical_metric = InvariantMetric(
             group=self,
-            inner_product_mat_at_identity=gs.eye(self.dimension),
+            inner_product_mat_at_identity=identity_mat,
             left_or_right="right",
         )
 
@@ -181,13 +182,17 @@ class LieGroup(Manifold):
 
         if point_type == "vector":
             tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=2)
-            inv_jacobian = gs.linalg.inv(jacobian)
-
-            tangent_vec_at_id = gs.einsum(
-                "ni,nij->nj",
-                tangent_vec,
-                gs.transpose(inv_jacobian, axes=(0, 2, 1)),
-            )
+            n_tangent_vecs = tangent_vec.shape[0]
+            n_base_points = jacobian.shape[0]
+            if n_tangent_vecs == 1:
+                tangent_vec = gs.broadcast_to(
+                    tangent_vec, (n_base_points, self.dimension))
+            if n_base_points == 1:
+                jacobian = gs.broadcast_to(
+                    jacobian,
+                    (n_tangent_vecs, self.dimension, self.dimension))
+            tangent_vec_at_id = gs.linalg.solve(
+                jacobian, gs.expand_dims(tangent_vec, axis=2))[:, :, 0]
             group_exp_from_identity = self.group_exp_from_identity(
                 tangent_vec=tangent_vec_at_id, point_type=point_type
             )
@@ -221,17 +226,22 @@ class LieGroup(Manifold):
         if point_type is None:
             point_type = self.default_point_type
 
+        if point_type == "vector":
+            tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=2)
+        if point_type == "matrix":
+            tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
+
+        if base_point is None:
+            return self.group_exp_from_identity(
+                tangent_vec, point_type=point_type)
+
         identity = self.get_identity(point_type=point_type)
         identity = self.regularize(identity, point_type=point_type)
-        if base_point is None:
-            base_point = identity
         base_point = self.regularize(base_point, point_type=point_type)
 
         if point_type == "vector":
-            tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=2)
             base_point = gs.to_ndarray(base_point, to_ndim=2)
         if point_type == "matrix":
-            tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
             base_point = gs.to_ndarray(base_point, to_ndim=3)
 
         n_tangent_vecs = tangent_vec.shape[0]
@@ -243,17 +253,17 @@ class LieGroup(Manifold):
             or n_base_points == 1
         )
 
-        if n_tangent_vecs == 1:
-            tangent_vec = gs.array([tangent_vec[0]] * n_base_points)
-
-        if n_base_points == 1:
-            base_point = gs.array([base_point[0]] * n_tangent_vecs)
+        def exp_from_identity():
+            exp = self.group_exp_from_identity(
+                tangent_vec, point_type=point_type)
+            if n_tangent_vecs < n_base_points:
+                exp = gs.tile(
+                    exp, (n_base_points,) + (1,) * (gs.ndim(exp) - 1))
+            return exp
 
         result = gs.cond(
             pred=gs.allclose(base_point, identity),
-            true_fn=lambda: self.group_exp_from_identity(
-                tangent_vec, point_type=point_type
-            ),
+            true_fn=exp_from_identity,
             false_fn=lambda: self.group_exp_not_from_identity(
                 tangent_vec, base_point, point_type))
         return result
@@ -300,13 +310,12 @@ class LieGroup(Manifold):
             point=point_near_id, point_type=point_type
         )
 
-        group_log = gs.einsum(
-            "ni,nij->nj",
-            group_log_from_id,
-            gs.transpose(jacobian, axes=(0, 2, 1)),
-        )
+        n_points = group_log_from_id.shape[0]
+        if jacobian.shape[0] == 1:
+            jacobian = gs.broadcast_to(
+                jacobian, (n_points, self.dimension, self.dimension))
 
-        assert gs.ndim(group_log) == 2
+        group_log = gs.einsum("ni,nji->nj", group_log_from_id, jacobian)
         return group_log
 
     def group_log(self, point, base_point=None, point_type=None):
@@ -326,18 +335,23 @@ class LieGroup(Manifold):
         if point_type is None:
             point_type = self.default_point_type
 
-        identity = self.get_identity(point_type=point_type)
+        if point_type == "vector":
+            point = gs.to_ndarray(point, to_ndim=2)
+        if point_type == "matrix":
+            point = gs.to_ndarray(point, to_ndim=3)
+
+        point = self.regularize(point, point_type=point_type)
+
         if base_point is None:
-            base_point = identity
+            return self.group_log_from_identity(point, point_type=point_type)
+
+        identity = self.get_identity(point_type=point_type)
 
         if point_type == "vector":
-            point = gs.to_ndarray(point, to_ndim=2)
             base_point = gs.to_ndarray(base_point, to_ndim=2)
         if point_type == "matrix":
-            point = gs.to_ndarray(point, to_ndim=3)
             base_point = gs.to_ndarray(base_point, to_ndim=3)
 
-        point = self.regularize(point, point_type=point_type)
         base_point = self.regularize(base_point, point_type=point_type)
 
         n_points = point.shape[0]
@@ -349,22 +363,18 @@ class LieGroup(Manifold):
             or n_base_points == 1
         )
 
-        if n_points == 1:
-            point = gs.array([point[0]] * n_base_points)
-
-        if n_base_points == 1:
-            base_point = gs.array([base_point[0]] * n_points)
+        def log_from_identity():
+            log = self.group_log_from_identity(point, point_type=point_type)
+            if n_points < n_base_points:
+                log = gs.tile(
+                    log, (n_base_points,) + (1,) * (gs.ndim(log) - 1))
+            return log
 
         result = gs.cond(
             pred=gs.allclose(base_point, identity),
-            true_fn=lambda: self.group_log_from_identity(
-                point, point_type=point_type
-            ),
+            true_fn=log_from_identity,
             false_fn=lambda: self.group_log_not_from_identity(
-                point, base_point, point_type
-            ),
-        )
-
+                point, base_point, point_type))
         return result
 
     def group_exponential_barycenter(
@@ -411,14 +421,15 @@ class LieGroup(Manifold):
         bracket: array-like, shape=[n_samples, n, n]
 
         """
+        tangent_vector_a = gs.to_ndarray(tangent_vector_a, to_ndim=3)
+        tangent_vector_b = gs.to_ndarray(tangent_vector_b, to_ndim=3)
 
         if base_point is None:
-            base_point = self.identity
+            # At the identity, the bracket is the matrix commutator.
+            return (gs.matmul(tangent_vector_a, tangent_vector_b)
+                    - gs.matmul(tangent_vector_b, tangent_vector_a))
 
         base_point = gs.to_ndarray(base_point, to_ndim=3)
-        tangent_vector_a = gs.to_ndarray(tangent_vector_a, to_ndim=3)
-        tangent_vector_b = gs.to_ndarray(tangent_vector_b, to_ndim=3)
-
         inverse_base = gs.to_ndarray(
             self.inverse(base_point, point_type="matrix"), to_ndim=3
         )
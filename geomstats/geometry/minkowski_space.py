@@ -30,10 +30,8 @@ class MinkowskiSpace(Manifold):
         """
         point = gs.to_ndarray(point, to_ndim=2)
         n_points, point_dim = point.shape
-        belongs = point_dim == self.dimension
-        belongs = gs.to_ndarray(belongs, to_ndim=1)
-        belongs = gs.to_ndarray(belongs, to_ndim=2, axis=1)
-        belongs = gs.tile(belongs, (n_points, 1))
+        belongs = gs.array(point_dim == self.dimension)
+        belongs = gs.broadcast_to(belongs, (n_points, 1))
 
         return belongs
 
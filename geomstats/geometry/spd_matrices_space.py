@@ -437,7 +437,7 @@ class SPDMetricAffine(RiemannianMetric):
                                       tangent_vec)
         tangent_vec_at_id = gs.matmul(tangent_vec_at_id,
                                       inv_sqrt_base_point)
-        exp_from_id = gs.linalg.expm(tangent_vec_at_id)
+        exp_from_id = gs.linalg.expm(tangent_vec_at_id, assume_symmetric=True)
 
         exp = gs.matmul(exp_from_id, sqrt_base_point)
         exp = gs.matmul(sqrt_base_point, exp)
@@ -482,7 +482,8 @@ class SPDMetricAffine(RiemannianMetric):
             power_inv_sqrt_base_point = gs.linalg.inv(power_sqrt_base_point)
             exp = self._aux_exp(modified_tangent_vec, power_sqrt_base_point,
                                 power_inv_sqrt_base_point)
-            exp = gs.linalg.powerm(exp, 1/power_affine)
+            exp = gs.linalg.powerm(
+                exp, 1/power_affine, assume_symmetric=True)
 
         if ndim == 2:
             return exp[0]
@@ -491,7 +492,7 @@ class SPDMetricAffine(RiemannianMetric):
     def _aux_log(self, point, sqrt_base_point, inv_sqrt_base_point):
         point_near_id = gs.matmul(inv_sqrt_base_point, point)
         point_near_id = gs.matmul(point_near_id, inv_sqrt_base_point)
-        log_at_id = gs.linalg.logm(point_near_id)
+        log_at_id = gs.linalg.logm(point_near_id, assume_symmetric=True)
 
         log = gs.matmul(sqrt_base_point, log_at_id)
         log = gs.matmul(log, sqrt_base_point)
@@ -75,10 +75,8 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         if point_type == 'vector':
             point = gs.to_ndarray(point, to_ndim=2)
             n_points, vec_dim = point.shape
-            belongs = vec_dim == self.dimension
-            belongs = gs.to_ndarray(belongs, to_ndim=1)
-            belongs = gs.to_ndarray(belongs, to_ndim=2, axis=1)
-            belongs = gs.tile(belongs, (n_points, 1))
+            belongs = gs.array(vec_dim == self.dimension)
+            belongs = gs.broadcast_to(belongs, (n_points, 1))
             return belongs
 
         elif point_type == 'matrix':
@@ -1289,7 +1287,7 @@ class SpecialOrthogonalGroup(LieGroup, EmbeddedManifold):
         if point_type == 'vector':
             point = gs.to_ndarray(tangent_vec, to_ndim=2)
         elif point_type == 'matrix' and self.n > 3:
-            return gs.linalg.expm(tangent_vec)
+            return gs.linalg.expm(tangent_vec, assume_symmetric=False)
         elif point_type == 'matrix':
             tangent_vec = gs.to_ndarray(tangent_vec, to_ndim=3)
             tangent_vec = self.vector_from_skew_matrix(tangent_vec)
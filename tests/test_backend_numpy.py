@@ -56,6 +56,91 @@ class TestBackendNumpy(geomstats.tests.TestCase):
 
         self.assertAllClose(result, expected)
 
+    def test_expm_vectorization_symmetric(self):
+        a, b = 1., 7.
+        point = gs.array([[[a, b],
+                           [b, a]],
+                          [[.5, 0.],
+                           [0., -.5]]])
+
+        expected = gs.array([[[gs.exp(a) * gs.cosh(b),
+                               gs.exp(a) * gs.sinh(b)],
+                              [gs.exp(a) * gs.sinh(b),
+                               gs.exp(a) * gs.cosh(b)]],
+                             [[gs.exp(.5), 0.],
+                              [0., gs.exp(-.5)]]])
+
+        result = gs.linalg.expm(point)
+
+        self.assertAllClose(result, expected)
+
+    def test_expm_vectorization_symmetric_stack(self):
+        a, b, c = 1., 7., -2.
+        n_samples = 100
+        point = gs.array([[a, b, 0.],
+                          [b, a, 0.],
+                          [0., 0., c]])
+        point = gs.array([point] * n_samples)
+
+        expected = gs.array([[gs.exp(a) * gs.cosh(b),
+                              gs.exp(a) * gs.sinh(b), 0.],
+                             [gs.exp(a) * gs.sinh(b),
+                              gs.exp(a) * gs.cosh(b), 0.],
+                             [0., 0., gs.exp(c)]])
+        expected = gs.array([expected] * n_samples)
+
+        result = gs.linalg.expm(point)
+
+        self.assertAllClose(result, expected)
+
+    def test_expm_assume_symmetric(self):
+        point = gs.array([[[1., 2.],
+                           [2., 1.]],
+                          [[2., -1.],
+                           [-1., 3.]]])
+        eigvals, eigvecs = gs.linalg.eigh(point)
+        expected = gs.matmul(
+            eigvecs * gs.exp(eigvals)[:, None, :],
+            gs.transpose(eigvecs, axes=(0, 2, 1)))
+
+        # The symmetric input is sent to the general path.
+        result = gs.linalg.expm(point, assume_symmetric=False)
+
+        self.assertAllClose(result, expected)
+
+    def test_expm_assume_symmetric_up_to_rounding(self):
+        symmetric_point = gs.array([[[1., 2.],
+                                     [2., 1.]]])
+        point = symmetric_point + gs.array([[[0., 1e-15],
+                                             [0., 0.]]])
+
+        # The symmetric path only reads the lower triangle.
+        expected = gs.linalg.expm(symmetric_point)
+        result = gs.linalg.expm(point, assume_symmetric=True)
+
+        self.assertTrue(gs.all(result == expected))
+        self.assertAllClose(result, gs.transpose(result, axes=(0, 2, 1)))
+
+    def test_expm_vectorization_skew_symmetric(self):
+        angle = 2.
+        point = gs.array([[[0., -angle, 0.],
+                           [angle, 0., 0.],
+                           [0., 0., 0.]],
+                          [[0., 0., 0.],
+                           [0., 0., 0.],
+                           [0., 0., 0.]]])
+
+        expected = gs.array([[[gs.cos(angle), -gs.sin(angle), 0.],
+                              [gs.sin(angle), gs.cos(angle), 0.],
+                              [0., 0., 1.]],
+                             [[1., 0., 0.],
+                              [0., 1., 0.],
+                              [0., 0., 1.]]])
+
+        result = gs.linalg.expm(point)
+
+        self.assertAllClose(result, expected)
+
     def test_logm_vectorization_diagonal(self):
         point = gs.array([[[2., 0., 0.],
                            [0., 3., 0.],
@@ -75,6 +160,22 @@ class TestBackendNumpy(geomstats.tests.TestCase):
 
         self.assertAllClose(result, expected)
 
+    def test_logm_vectorization_small_eigenvalues(self):
+        log_1, log_2 = gs.log(.75), gs.log(.25)
+        point = gs.array([[[.5, .25],
+                           [.25, .5]],
+                          [[.5, 0.],
+                           [0., 2.]]])
+
+        expected = gs.array([[[(log_1 + log_2) / 2, (log_1 - log_2) / 2],
+                              [(log_1 - log_2) / 2, (log_1 + log_2) / 2]],
+                             [[gs.log(.5), 0.],
+                              [0., gs.log(2.)]]])
+
+        result = gs.linalg.logm(point)
+
+        self.assertAllClose(result, expected)
+
     def test_expm_and_logm_vectorization_random_rotation(self):
         point = self.so3_group.random_uniform(self.n_samples)
         point = self.so3_group.matrix_from_rotation_vector(point)
@@ -132,3 +233,82 @@ class TestBackendNumpy(geomstats.tests.TestCase):
         expected = points
 
         self.assertAllClose(result, expected)
+
+    def test_sqrtm_vectorization(self):
+        points = gs.array([[[1., 0., 0.],
+                            [0., 4., 0.],
+                            [0., 0., 9.]],
+                           [[4., 0., 0.],
+                            [0., 2.5, 1.5],
+                            [0., 1.5, 2.5]]])
+        result = gs.linalg.sqrtm(points)
+        expected = gs.array([[[1., 0., 0.],
+                              [0., 2., 0.],
+                              [0., 0., 3.]],
+                             [[2., 0., 0.],
+                              [0., 1.5, .5],
+                              [0., .5, 1.5]]])
+
+        self.assertAllClose(result, expected)
+
+    def test_qr_vectorization(self):
+        points = gs.array([[[1., 2.],
+                            [3., 4.],
+                            [5., 6.]],
+                           [[2., 0.],
+                            [0., 1.],
+                            [1., 1.]]])
+        matrix_q, matrix_r = gs.linalg.qr(points)
+
+        result = gs.matmul(matrix_q, matrix_r)
+        expected = points
+        self.assertAllClose(result, expected)
+
+        result = gs.matmul(gs.transpose(matrix_q, axes=(0, 2, 1)), matrix_q)
+        expected = gs.array([gs.eye(2), gs.eye(2)])
+        self.assertAllClose(result, expected)
+
+    def test_powerm_integer_power_indefinite(self):
+        point = gs.array([[[0., 1.],
+                           [1., 0.]],
+                          [[-2., 0.],
+                           [0., 1.]]])
+
+        result = gs.linalg.powerm(point, 3)
+        expected = gs.array([[[0., 1.],
+                              [1., 0.]],
+                             [[-8., 0.],
+                              [0., 1.]]])
+        self.assertAllClose(result, expected)
+
+        result = gs.linalg.powerm(point, -1)
+        expected = gs.linalg.inv(point)
+        self.assertAllClose(result, expected)
+
+    def test_logm_assume_symmetric_up_to_rounding(self):
+        symmetric_point = gs.array([[[2., 1.],
+                                     [1., 2.]]])
+        point = symmetric_point + gs.array([[[0., 1e-15],
+                                             [0., 0.]]])
+
+        # The symmetric path only reads the lower triangle.
+        expected = gs.linalg.logm(symmetric_point)
+        result = gs.linalg.logm(point, assume_symmetric=True)
+
+        self.assertTrue(gs.all(result == expected))
+        self.assertAllClose(result, gs.transpose(result, axes=(0, 2, 1)))
+
+    def test_powerm_assume_symmetric_up_to_rounding(self):
+        symmetric_point = gs.array([[[2., 1.],
+                                     [1., 2.]]])
+        point = symmetric_point + gs.array([[[0., 1e-15],
+                                             [0., 0.]]])
+
+        # The symmetric path only reads the lower triangle.
+        for power in [.5, -.5, 2, 1.3]:
+            expected = gs.linalg.powerm(symmetric_point, power)
+            result = gs.linalg.powerm(point, power, assume_symmetric=True)
+
+            self.assertTrue(gs.all(result == expected))
+            self.assertAllClose(
+                result, gs.transpose(result, axes=(0, 2, 1)))
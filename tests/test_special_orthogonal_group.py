@@ -3372,6 +3372,40 @@ class TestSpecialOrthogonalGroupMethods(geomstats.tests.TestCase):
         self.assertAllClose(
             gs.shape(result), (n_samples, group.dimension))
 
+    @geomstats.tests.np_only
+    def test_group_exp_vectorization_at_identities(self):
+        n = 3
+        group = self.so[n]
+
+        n_samples = self.n_samples
+        tangent_vec = group.random_uniform(n_samples=1)
+        base_points = gs.array([group.identity] * n_samples)
+        result = group.group_exp(tangent_vec, base_points)
+
+        expected = group.group_exp_from_identity(tangent_vec)
+        expected = gs.array([expected[0]] * n_samples)
+
+        self.assertAllClose(
+            gs.shape(result), (n_samples, group.dimension))
+        self.assertAllClose(result, expected)
+
+    @geomstats.tests.np_only
+    def test_group_log_vectorization_at_identities(self):
+        n = 3
+        group = self.so[n]
+
+        n_samples = self.n_samples
+        point = group.random_uniform(n_samples=1)
+        base_points = gs.array([group.identity] * n_samples)
+        result = group.group_log(point, base_points)
+
+        expected = group.group_log_from_identity(point)
+        expected = gs.array([expected[0]] * n_samples)
+
+        self.assertAllClose(
+            gs.shape(result), (n_samples, group.dimension))
+        self.assertAllClose(result, expected)
+
     def test_group_exp_then_log_from_identity(self):
         """
         Test that the group exponential
@@ -3799,6 +3833,23 @@ class TestSpecialOrthogonalGroupMethods(geomstats.tests.TestCase):
 
         self.assertAllClose(result, expected)
 
+    def test_lie_bracket_default_base_point(self):
+        dim = 3
+        space = self.so[dim]
+        first_tan = gs.array([
+            [0., -1., 0.],
+            [1., 0., 0.],
+            [0., 0., 0.]])
+        second_tan = gs.array([
+            [0., 0., -1.],
+            [0., 0., 0.],
+            [1., 0., 0.]])
+
+        result = space.lie_bracket(first_tan, second_tan)
+        expected = space.lie_bracket(first_tan, second_tan, gs.eye(dim))
+
+        self.assertAllClose(result, expected)
+
     @geomstats.tests.np_only
     def test_lie_bracket_vectorization(self):
         dim = 3